@@ -0,0 +1,85 @@
+# cython: language_level=3
+"""C implementation of the scalar donut renderer.
+
+Build in place with ``cythonize -i _donut.pyx``; donut.py falls back to
+its NumPy renderer when this extension is not importable.
+"""
+cimport cython
+from libc.math cimport cos, sin, floor, M_PI
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def render_frame_c(float[:, ::1] zbuffer, unsigned char[:, ::1] output,
+                   int W, int H, double R1, double R2, double K1, double K2,
+                   double theta_step, double phi_step, double cosA, double sinA,
+                   double cosB, double sinB, int n_chars):
+    """Render one frame point by point into preallocated buffers"""
+    cdef double theta, phi, costheta, sintheta, cosphi, sinphi
+    cdef double circlex, circley, x, y, z, ooz, L1, luminance
+    cdef double sA_sB, cA_sB, sA_cB, cA_cB, light_phi, sB_cp
+    cdef double x_theta, y_theta, z_theta, cA_circlex, light_theta
+    cdef double half_w = W * 0.5
+    cdef double half_h = H * 0.5
+    cdef int xp, yp, char_idx
+    
+    # Rotation products shared by every point
+    sA_sB = sinA * sinB
+    cA_sB = cosA * sinB
+    sA_cB = sinA * cosB
+    cA_cB = cosA * cosB
+    light_phi = cosA + sA_cB
+    
+    theta = 0.0
+    while theta < 2 * M_PI:
+        costheta = cos(theta)
+        sintheta = sin(theta)
+        
+        # 3D coordinates on torus surface
+        circlex = R2 + R1 * costheta
+        circley = R1 * sintheta
+        
+        # Terms that only depend on theta
+        x_theta = circley * cA_sB
+        y_theta = circley * cA_cB
+        z_theta = K2 + circley * sinA
+        cA_circlex = cosA * circlex
+        light_theta = sintheta * (cA_cB - sinA)
+        
+        phi = 0.0
+        while phi < 2 * M_PI:
+            cosphi = cos(phi)
+            sinphi = sin(phi)
+            
+            sB_cp = sinB * cosphi
+            
+            # Apply 3D rotations
+            x = circlex * (cosB * cosphi + sA_sB * sinphi) - x_theta
+            y = circlex * (sB_cp - sA_cB * sinphi) + y_theta
+            z = z_theta + cA_circlex * sinphi
+            
+            # Perspective projection
+            ooz = 1 / z
+            xp = <int>floor(half_w + K1 * ooz * x)
+            yp = <int>floor(half_h - K1 * ooz * y)
+            
+            # Check bounds and depth
+            if 0 <= xp < W and 0 <= yp < H and ooz > zbuffer[yp, xp]:
+                zbuffer[yp, xp] = <float>ooz
+                
+                L1 = costheta * (sB_cp - light_phi * sinphi) + light_theta
+                luminance = L1 * 0.8 + 0.2
+                if luminance < 0:
+                    luminance = 0
+                
+                # Map luminance to character
+                char_idx = <int>(luminance * (n_chars - 1))
+                if char_idx < 0:
+                    char_idx = 0
+                elif char_idx > n_chars - 1:
+                    char_idx = n_chars - 1
+                output[yp, xp] = <unsigned char>char_idx
+            
+            phi += phi_step
+        theta += theta_step
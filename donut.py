@@ -2,9 +2,157 @@ import math
 import time
 import os
 import sys
-from typing import List, Tuple
+from typing import ClassVar, Dict, List, Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+try:
+    from _donut import render_frame_c
+except ImportError:  # Cython extension is optional, built with `cythonize -i _donut.pyx`
+    render_frame_c = None
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy is optional
+    cp = None
+
+def _render_frame_scalar(W: int, H: int, R1: float, R2: float, K1: float, K2: float,
+                         theta_step: float, phi_step: float, cosA: float, sinA: float,
+                         cosB: float, sinB: float, zbuffer: np.ndarray,
+                         output_idx: np.ndarray, n_chars: int):
+    """Render one frame point by point into preallocated buffers"""
+    half_w = W * 0.5
+    half_h = H * 0.5
+    
+    # Rotation products shared by every point
+    sA_sB = sinA * sinB
+    cA_sB = cosA * sinB
+    sA_cB = sinA * cosB
+    cA_cB = cosA * cosB
+    light_phi = cosA + sA_cB
+    
+    theta = 0.0
+    while theta < 2 * math.pi:
+        costheta = math.cos(theta)
+        sintheta = math.sin(theta)
+        
+        # 3D coordinates on torus surface
+        circlex = R2 + R1 * costheta
+        circley = R1 * sintheta
+        
+        # Terms that only depend on theta
+        x_theta = circley * cA_sB
+        y_theta = circley * cA_cB
+        z_theta = K2 + circley * sinA
+        cA_circlex = cosA * circlex
+        light_theta = sintheta * (cA_cB - sinA)
+        
+        phi = 0.0
+        while phi < 2 * math.pi:
+            cosphi = math.cos(phi)
+            sinphi = math.sin(phi)
+            
+            sB_cp = sinB * cosphi
+            
+            # Apply 3D rotations
+            x = circlex * (cosB * cosphi + sA_sB * sinphi) - x_theta
+            y = circlex * (sB_cp - sA_cB * sinphi) + y_theta
+            z = z_theta + cA_circlex * sinphi
+            
+            # Perspective projection
+            ooz = 1 / z
+            xp = math.floor(half_w + K1 * ooz * x)
+            yp = math.floor(half_h - K1 * ooz * y)
+            
+            # Check bounds and depth
+            if 0 <= xp < W and 0 <= yp < H and ooz > zbuffer[yp, xp]:
+                zbuffer[yp, xp] = ooz
+                
+                L1 = costheta * (sB_cp - light_phi * sinphi) + light_theta
+                luminance = max(0.0, L1 * 0.8 + 0.2)
+                
+                # Map luminance to character
+                char_index = int(luminance * (n_chars - 1))
+                output_idx[yp, xp] = max(0, min(n_chars - 1, char_index))
+            
+            phi += phi_step
+        theta += theta_step
+
+# JIT-compiled scalar renderer, used when Numba is installed
+_render_frame_numba = njit(cache=True, fastmath=True)(_render_frame_scalar) if njit else None
+
+def _make_render(W: int, H: int, K1: float, K2: float, points, normals,
+                 n_chars: int, lib=np):
+    """Build a vectorized renderer with the donut's fixed parameters bound as locals"""
+    half_w = W * 0.5
+    half_h = H * 0.5
+    light_dir = lib.array([0.0, 1.0, -1.0], dtype=lib.float32)
+    on_gpu = lib is not np
+    
+    def render(cosA: float, sinA: float, cosB: float, sinB: float,
+               zbuffer: np.ndarray, output: np.ndarray):
+        """Project, shade and depth-resolve every surface point into the buffers"""
+        # Rotation about the x axis (A) followed by the z axis (B)
+        rotation = lib.asarray(np.array([
+            [cosB, -cosA * sinB, sinA * sinB],
+            [sinB, cosA * cosB, -sinA * cosB],
+            [0.0, sinA, cosA],
+        ], dtype=np.float32))
+        
+        # Enhanced luminance: light direction (0, 1, -1) against rotated normals
+        L1 = (rotation.T @ light_dir) @ normals
+        
+        # Apply 3D rotations to every surface point in one product
+        x, y, z = rotation @ points
+        z += K2
+        
+        # Perspective projection
+        ooz = 1.0 / z
+        xp = lib.floor(half_w + K1 * ooz * x).astype(lib.int32)
+        yp = lib.floor(half_h - K1 * ooz * y).astype(lib.int32)
+        
+        # Keep only points that land on screen
+        mask = (xp >= 0) & (xp < W) & (yp >= 0) & (yp < H)
+        xp, yp, ooz, L1 = xp[mask], yp[mask], ooz[mask], L1[mask]
+        
+        # Add ambient lighting and map luminance to character
+        luminance = lib.maximum(0, L1 * 0.8 + 0.2)
+        char_index = lib.clip((luminance * (n_chars - 1)).astype(lib.int32), 0, n_chars - 1)
+        flat_idx = yp * W + xp
+        
+        if on_gpu:
+            # GPU scatters have no write order, so keep only the nearest point per pixel
+            order = lib.lexsort(lib.stack([ooz, flat_idx]))
+            flat_idx, ooz, char_index = flat_idx[order], ooz[order], char_index[order]
+            nearest = lib.ones(flat_idx.size, dtype=bool)
+            nearest[:-1] = flat_idx[1:] != flat_idx[:-1]
+            flat_idx, ooz, char_index = (lib.asnumpy(a[nearest]) for a in (flat_idx, ooz, char_index))
+            np.put(zbuffer, flat_idx, ooz)
+            np.put(output, flat_idx, char_index)
+            return
+        
+        # Paint farthest first so the nearest point wins each pixel
+        order = np.argsort(ooz, kind='stable')
+        flat_idx = flat_idx[order]
+        np.put(zbuffer, flat_idx, ooz[order])
+        np.put(output, flat_idx, char_index[order])
+    
+    return render
 
 class ASCIIDonut:
+    # Enhanced character sets for better shading
+    _STYLES: ClassVar[Dict[str, str]] = {
+        'classic': " .':!~;irsXA253hMHGS#9&@",
+        'minimal': " .-=+*#@",
+        'blocks': " ░▒▓█",
+        'dots': " ·∘○●"
+    }
+    
     def __init__(self, width: int = 120, height: int = 30):
         self.width = width
         self.height = height
@@ -13,19 +161,32 @@ class ASCIIDonut:
         self.K2 = 5.0      # Distance from viewer
         self.K1 = width * self.K2 * 3 / (8 * (self.R1 + self.R2))
         
-        # Enhanced character sets for better shading
-        self.luminance_chars = " .':!~;irsXA253hMHGS#9&@"
-        self.color_chars = {
-            'classic': " .':!~;irsXA253hMHGS#9&@",
-            'minimal': " .-=+*#@",
-            'blocks': " ░▒▓█",
-            'dots': " ·∘○●"
-        }
-        
         # Pre-calculate common values
         self.theta_step = 0.07
         self.phi_step = 0.02
-        self.chars = self.luminance_chars
+        
+        # Surface sample angles never change, so the surface tables are built once
+        theta = np.arange(0, 2 * math.pi, self.theta_step)
+        phi = np.arange(0, 2 * math.pi, self.phi_step)
+        cos_theta = np.cos(theta)[:, np.newaxis]
+        sin_theta = np.sin(theta)[:, np.newaxis]
+        cos_phi = np.cos(phi)[np.newaxis, :]
+        sin_phi = np.sin(phi)[np.newaxis, :]
+        
+        # Unrotated surface points and normals as (3, N) float32 arrays
+        circlex = self.R2 + self.R1 * cos_theta
+        circley = self.R1 * sin_theta
+        shape = (len(theta), len(phi))
+        self._points = np.stack([
+            circlex * cos_phi,
+            np.broadcast_to(circley, shape),
+            circlex * sin_phi,
+        ]).reshape(3, -1).astype(np.float32)
+        self._normals = np.stack([
+            cos_theta * cos_phi,
+            np.broadcast_to(sin_theta, shape),
+            cos_theta * sin_phi,
+        ]).reshape(3, -1).astype(np.float32)
         
         # Animation parameters
         self.A = 0.0  # X rotation
@@ -33,22 +194,69 @@ class ASCIIDonut:
         self.A_speed = 0.08
         self.B_speed = 0.03
         
+        # Cached rotation trig, advanced incrementally by spin()
+        self._cA, self._sA = 1.0, 0.0
+        self._cB, self._sB = 1.0, 0.0
+        self._trig_angles = (self.A, self.B)
+        
         # Pre-allocate buffers for better performance
-        self.output = [[' ' for _ in range(width)] for _ in range(height)]
-        self.zbuffer = [[0.0 for _ in range(width)] for _ in range(height)]
+        # output holds indices into self.chars; index 0 is always a space
+        self.output = np.zeros((height, width), dtype=np.uint8)
+        self.zbuffer = np.zeros((height, width), dtype=np.float32)
         
         # Color support
         self.use_colors = self._check_color_support()
         
+        # Frames are written straight to the stdout file descriptor when possible
+        self._stdout_fd = self._get_stdout_fd()
+        self._stdout_encoding = getattr(sys.stdout, 'encoding', None) or 'utf-8'
+        
+        # Optional Numba-compiled scalar renderer
+        self.use_numba = False
+        
+        # Optional Cython-compiled scalar renderer
+        self.use_cython = False
+        
+        # Optional CuPy renderer; surface tables are copied to the GPU on enable
+        self.use_gpu = False
+        self._gpu_tables = None
+        
+        # Character style; assigning chars builds the glyph, color and renderer tables
+        self.style = None
+        self._chars = None
+        self.set_style('classic')
+        
     def _check_color_support(self) -> bool:
         """Check if terminal supports colors"""
         return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
     
-    def _get_color_code(self, luminance: float) -> str:
-        """Get ANSI color code based on luminance"""
-        if not self.use_colors:
-            return ""
+    def _get_stdout_fd(self) -> Optional[int]:
+        """Return the stdout file descriptor, or None if frames should go through sys.stdout"""
+        # The Windows console decodes raw fd bytes in its code page, not UTF-8
+        if os.name == 'nt':
+            return None
+        try:
+            return sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+    
+    def _write(self, text: str):
+        """Write text to the terminal, bypassing print() when a descriptor is cached"""
+        if self._stdout_fd is None:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            return
         
+        # Anything still buffered by print() must reach the terminal first
+        sys.stdout.flush()
+        data = memoryview(text.encode(self._stdout_encoding, errors='replace'))
+        while data:
+            written = os.write(self._stdout_fd, data)
+            data = data[written:]
+    
+    @staticmethod
+    def _get_color_code(luminance: float) -> str:
+        """Get ANSI color code based on luminance"""
         # Map luminance to color gradient (blue to yellow to red)
         if luminance < 0.2:
             return "\033[34m"  # Blue
@@ -61,9 +269,10 @@ class ASCIIDonut:
         else:
             return "\033[31m"  # Red
     
-    def _reset_color(self) -> str:
-        """Reset color to default"""
-        return "\033[0m" if self.use_colors else ""
+    def _update_color_lut(self):
+        """Cache the color code for each character index of the current style"""
+        # display_frame checks use_colors itself, so the codes are stored unconditionally
+        self._color_lut = [self._get_color_code(i / len(self.chars)) for i in range(len(self.chars))]
     
     def clear_screen(self):
         """Optimized screen clearing"""
@@ -71,148 +280,195 @@ class ASCIIDonut:
             os.system('cls')
         else:
             # Use ANSI escape codes for faster clearing
-            print("\033[2J\033[H", end="")
+            self._write("\033[2J\033[H")
     
     def reset_buffers(self):
         """Reset output and z-buffer efficiently"""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.output[y][x] = ' '
-                self.zbuffer[y][x] = 0.0
-    
-    def calculate_point(self, theta: float, phi: float, cosA: float, sinA: float, 
-                       cosB: float, sinB: float) -> Tuple[int, int, float, float]:
-        """Calculate 3D point projection and luminance"""
-        # Pre-calculate trigonometric values
-        costheta = math.cos(theta)
-        sintheta = math.sin(theta)
-        cosphi = math.cos(phi)
-        sinphi = math.sin(phi)
-        
-        # 3D coordinates on torus surface
-        circlex = self.R2 + self.R1 * costheta
-        circley = self.R1 * sintheta
-        
-        # Apply 3D rotations
-        x = circlex * (cosB * cosphi + sinA * sinB * sinphi) - circley * cosA * sinB
-        y = circlex * (sinB * cosphi - sinA * cosB * sinphi) + circley * cosA * cosB
-        z = self.K2 + cosA * circlex * sinphi + circley * sinA
-        
-        # Perspective projection
-        ooz = 1 / z
-        xp = int(self.width / 2 + self.K1 * ooz * x)
-        yp = int(self.height / 2 - self.K1 * ooz * y)
-        
-        # Enhanced luminance calculation with multiple light sources
-        L1 = cosphi * costheta * sinB - cosA * costheta * sinphi - sinA * sintheta + cosB * (cosA * sintheta - costheta * sinA * sinphi)
-        
-        # Add ambient lighting and clamp values
-        luminance = max(0, L1 * 0.8 + 0.2)
-        
-        return xp, yp, ooz, luminance
+        self.output.fill(0)
+        self.zbuffer.fill(0.0)
+    
+    def _build_renderer(self):
+        """Specialize the vectorized renderer on the current shape, style and device"""
+        if self.use_gpu:
+            tables, lib = self._gpu_tables, cp
+        else:
+            tables, lib = (self._points, self._normals), np
+        self._render = _make_render(self.width, self.height, self.K1, self.K2, *tables,
+                                    self._char_table.size, lib)
     
     def render_frame(self):
         """Render a single frame of the donut"""
         self.reset_buffers()
         
-        # Pre-calculate rotation values
-        cosA = math.cos(self.A)
-        sinA = math.sin(self.A)
-        cosB = math.cos(self.B)
-        sinB = math.sin(self.B)
-        
-        # Generate donut surface points
-        theta = 0
-        while theta < 2 * math.pi:
-            phi = 0
-            while phi < 2 * math.pi:
-                xp, yp, ooz, luminance = self.calculate_point(
-                    theta, phi, cosA, sinA, cosB, sinB
-                )
-                
-                # Check bounds and depth
-                if (0 <= xp < self.width and 0 <= yp < self.height and 
-                    ooz > self.zbuffer[yp][xp]):
-                    
-                    self.zbuffer[yp][xp] = ooz
-                    
-                    # Map luminance to character
-                    char_index = int(luminance * (len(self.chars) - 1))
-                    char_index = max(0, min(len(self.chars) - 1, char_index))
-                    
-                    self.output[yp][xp] = self.chars[char_index]
-                
-                phi += self.phi_step
-            theta += self.theta_step
+        # Rotation values, recomputed only if A or B were set directly
+        if (self.A, self.B) != self._trig_angles:
+            self._cA, self._sA = math.cos(self.A), math.sin(self.A)
+            self._cB, self._sB = math.cos(self.B), math.sin(self.B)
+            self._trig_angles = (self.A, self.B)
+        cosA, sinA, cosB, sinB = self._cA, self._sA, self._cB, self._sB
+        
+        if self.use_numba:
+            _render_frame_numba(self.width, self.height, self.R1, self.R2, self.K1, self.K2,
+                                self.theta_step, self.phi_step, cosA, sinA, cosB, sinB,
+                                self.zbuffer, self.output, self._char_table.size)
+            return
+        
+        if self.use_cython:
+            render_frame_c(self.zbuffer, self.output, self.width, self.height,
+                           self.R1, self.R2, self.K1, self.K2, self.theta_step, self.phi_step,
+                           cosA, sinA, cosB, sinB, self._char_table.size)
+            return
+        
+        # Vectorized renderer specialized on this donut's fixed parameters
+        self._render(cosA, sinA, cosB, sinB, self.zbuffer, self.output)
+    
+    def frame_rows(self) -> List[str]:
+        """Return the rendered frame as one string per row"""
+        # Gather glyphs for the whole grid, then view each row as one string
+        glyphs = self._char_table[self.output]
+        return glyphs.view(f'U{self.width}').ravel().tolist()
     
     def display_frame(self):
         """Display the current frame with optional colors"""
-        self.clear_screen()
-        
-        # Print header
-        print(f"\033[1;37m{'='*self.width}\033[0m")
-        print(f"\033[1;36m{'ASCII DONUT':^{self.width}}\033[0m")
-        print(f"\033[1;37m{'='*self.width}\033[0m")
+        # Every cell is redrawn, so homing the cursor is enough between frames
+        lines = [
+            f"\033[H\033[1;37m{'='*self.width}\033[0m",
+            f"\033[1;36m{'ASCII DONUT':^{self.width}}\033[0m",
+            f"\033[1;37m{'='*self.width}\033[0m",
+        ]
         
         # Render donut with or without colors
-        for y in range(self.height):
-            line = ""
-            for x in range(self.width):
-                char = self.output[y][x]
-                if char != ' ' and self.use_colors:
-                    # Add color based on character intensity
-                    char_intensity = self.chars.find(char) / len(self.chars)
-                    color_code = self._get_color_code(char_intensity)
-                    line += f"{color_code}{char}{self._reset_color()}"
-                else:
-                    line += char
-            print(line)
-        
-        # Print controls and info
-        print(f"\033[1;37m{'='*self.width}\033[0m")
+        if not self.use_colors:
+            lines.extend(self.frame_rows())
+        else:
+            color_lut = self._color_lut
+            glyphs = self._char_table.tolist()
+            for row in self.output.tolist():
+                parts = []
+                cur_color = None
+                for idx in row:
+                    if idx:
+                        # Only switch color when the intensity band changes
+                        color_code = color_lut[idx]
+                        if color_code != cur_color:
+                            parts.append(color_code)
+                            cur_color = color_code
+                    parts.append(glyphs[idx])
+                if cur_color is not None:
+                    parts.append("\033[0m")
+                lines.append("".join(parts))
+        
+        # Controls and info
+        lines.append(f"\033[1;37m{'='*self.width}\033[0m")
         color_mode = "Color" if self.use_colors else "Monochrome"
-        print(f"\033[1;33mRotation: A={self.A:.2f}° B={self.B:.2f}° | Mode: {color_mode} | Press Ctrl+C to stop\033[0m")
-        print(f"\033[1;32mResolution: {self.width}x{self.height} | FPS: ~30\033[0m")
+        lines.append(f"\033[1;33mRotation: A={self.A:.2f}° B={self.B:.2f}° | Mode: {color_mode} | Press Ctrl+C to stop\033[0m")
+        lines.append(f"\033[1;32mResolution: {self.width}x{self.height} | FPS: ~30\033[0m")
+        
+        # Emit the whole frame in a single write
+        self._write("\n".join(lines) + "\n")
     
     def set_color_mode(self, enable_colors: bool):
         """Enable or disable color output"""
         self.use_colors = enable_colors and self._check_color_support()
     
+    def set_numba_mode(self, enable_numba: bool):
+        """Enable or disable the Numba-compiled renderer"""
+        self.use_numba = enable_numba and _render_frame_numba is not None
+    
+    def set_cython_mode(self, enable_cython: bool):
+        """Enable or disable the Cython-compiled renderer"""
+        self.use_cython = enable_cython and render_frame_c is not None
+    
+    def set_gpu_mode(self, enable_gpu: bool):
+        """Enable or disable the CuPy renderer"""
+        self.use_gpu = enable_gpu and cp is not None
+        if self.use_gpu and self._gpu_tables is None:
+            self._gpu_tables = (cp.asarray(self._points), cp.asarray(self._normals))
+        self._build_renderer()
+    
     def set_style(self, style: str):
-        """Change the character style"""
-        if style in self.color_chars:
-            self.chars = self.color_chars[style]
-        else:
-            self.chars = self.luminance_chars
+        """Change the character style, falling back to classic for unknown names"""
+        if style not in self._STYLES:
+            style = 'classic'
+        if style == self.style and self.chars == self._STYLES[style]:
+            return
+        self.style = style
+        self.chars = self._STYLES[style]
+    
+    @property
+    def chars(self) -> str:
+        """Characters used for shading, from darkest to brightest"""
+        return self._chars
+    
+    @chars.setter
+    def chars(self, chars: str):
+        # Rebuild everything derived from the character set
+        self._chars = chars
+        self._char_table = np.array(list(chars))
+        self._update_color_lut()
+        self._build_renderer()
+    
+    def _advance_rotation(self, cAd: float, sAd: float, cBd: float, sBd: float):
+        """Step A and B by their speeds, rotating the cached cos/sin pairs"""
+        self._cA, self._sA = self._cA * cAd - self._sA * sAd, self._sA * cAd + self._cA * sAd
+        self._cB, self._sB = self._cB * cBd - self._sB * sBd, self._sB * cBd + self._cB * sBd
+        self.A += self.A_speed
+        self.B += self.B_speed
+        self._trig_angles = (self.A, self.B)
+    
+    def _renormalize_rotation(self):
+        """Remove accumulated drift from the cached cos/sin pairs"""
+        norm = math.hypot(self._cA, self._sA)
+        self._cA, self._sA = self._cA / norm, self._sA / norm
+        norm = math.hypot(self._cB, self._sB)
+        self._cB, self._sB = self._cB / norm, self._sB / norm
     
     def spin(self, duration: float = float('inf')):
         """Main animation loop"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         frame_count = 0
+        target_frame_time = 1.0 / 30.0
+        
+        # Per-frame rotation steps
+        cAd, sAd = math.cos(self.A_speed), math.sin(self.A_speed)
+        cBd, sBd = math.cos(self.B_speed), math.sin(self.B_speed)
         
+        # Animate on the alternate screen so frames stay out of the scrollback
+        self._write("\033[?1049h")
+        self.clear_screen()
+        
+        interrupted = False
         try:
-            while time.time() - start_time < duration:
-                frame_start = time.time()
+            while time.perf_counter() - start_time < duration:
+                frame_start = time.perf_counter()
                 
                 # Render and display frame
                 self.render_frame()
                 self.display_frame()
                 
                 # Update rotation angles
-                self.A += self.A_speed
-                self.B += self.B_speed
+                self._advance_rotation(cAd, sAd, cBd, sBd)
+                if frame_count % 1000 == 999:
+                    self._renormalize_rotation()
                 
-                # Maintain ~30 FPS
-                frame_time = time.time() - frame_start
-                target_frame_time = 1.0 / 30.0
-                if frame_time < target_frame_time:
-                    time.sleep(target_frame_time - frame_time)
+                # Maintain ~30 FPS: coarse sleep, then spin out the last couple of ms
+                deadline = frame_start + target_frame_time
+                slack = deadline - time.perf_counter()
+                if slack > 0.002:
+                    time.sleep(slack - 0.002)
+                while time.perf_counter() < deadline:
+                    pass
                 
                 frame_count += 1
                 
         except KeyboardInterrupt:
-            self.clear_screen()
-            elapsed = time.time() - start_time
+            interrupted = True
+        finally:
+            # Leaving the alternate screen restores the terminal as it was
+            self._write("\033[?1049l")
+        
+        if interrupted:
+            elapsed = time.perf_counter() - start_time
             avg_fps = frame_count / elapsed if elapsed > 0 else 0
             print(f"\n\033[1;32mDonut stopped after {elapsed:.1f}s")
             print(f"Average FPS: {avg_fps:.1f}\033[0m")
@@ -232,8 +488,8 @@ def demo_styles():
         donut.render_frame()
         
         print(f"\033[1;33m{style.upper()} Style:\033[0m")
-        for row in donut.output:
-            print(''.join(row))
+        for row in donut.frame_rows():
+            print(row)
         print()
 
 def create_donut(width: int = 120, height: int = 30, style: str = 'classic') -> ASCIIDonut: